@@ -102,6 +102,7 @@ NO_KEYCHAIN=false
 PLATFORMS=""
 VALIDATE_ONLY=false
 SKIP_CREDENTIALS=false
+SKIP_REUSE_VALIDATION=false
 
 while [[ $# -gt 0 ]]; do
     case $1 in
@@ -129,6 +130,10 @@ while [[ $# -gt 0 ]]; do
             SKIP_CREDENTIALS=true
             shift
             ;;
+        --skip-reuse-validation)
+            SKIP_REUSE_VALIDATION=true
+            shift
+            ;;
         --help|-h)
             echo "AS-Plugins Setup Wizard"
             echo ""
@@ -141,6 +146,8 @@ while [[ $# -gt 0 ]]; do
             echo "  --platforms        Comma-separated platforms (confluence,jira,splunk)"
             echo "  --validate-only    Validate existing credentials and exit"
             echo "  --skip-credentials Skip credential prompts, install packages/plugins only"
+            echo "  --skip-reuse-validation"
+            echo "                     Don't re-test Confluence credentials reused for JIRA"
             echo "  --help, -h         Show this help message"
             exit 0
             ;;
@@ -267,6 +274,7 @@ export AS_PLUGINS_NO_KEYCHAIN="$NO_KEYCHAIN"
 export AS_PLUGINS_PLATFORMS="$PLATFORMS"
 export AS_PLUGINS_VALIDATE_ONLY="$VALIDATE_ONLY"
 export AS_PLUGINS_SKIP_CREDENTIALS="$SKIP_CREDENTIALS"
+export AS_PLUGINS_SKIP_REUSE_VALIDATION="$SKIP_REUSE_VALIDATION"
 
 python3 -m scripts.setup.main
 
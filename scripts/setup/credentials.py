@@ -7,20 +7,45 @@ with validation and helpful defaults.
 """
 
 import re
+import sys
+from dataclasses import dataclass
 from getpass import getpass
+from types import MappingProxyType
+from typing import Callable, Optional
 
 from rich.console import Console
 from rich.prompt import Prompt
 
-from .env_file import mask_value, resolve_env_var
+from .env_file import mask_value, merge_env_sources
+
+try:
+    import re2 as _re  # Optional - google-re2 gives linear-time matching
+except ImportError:
+    _re = re
 
 console = Console()
 
-# Platform configuration
-PLATFORM_CONFIGS = {
+# Static console messages
+_VALUE_REQUIRED = "    [red]Value required[/red]"
+
+# Validator patterns, compiled once at import (used with fullmatch)
+_ATLASSIAN_URL_RE = _re.compile(r"https://[a-zA-Z0-9-]+\.atlassian\.net")
+_URL_RE = _re.compile(r"https?://[a-zA-Z0-9.-]+(?::\d+)?(?:/.*)?")
+_EMAIL_RE = _re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+
+
+def _read_only(value):
+    """Recursively wrap dicts in MappingProxyType."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _read_only(item) for key, item in value.items()})
+    return value
+
+
+# Platform configuration (read-only at every level)
+PLATFORM_CONFIGS = _read_only({
     "confluence": {
         "title": "Confluence Configuration",
-        "required_vars": ["CONFLUENCE_SITE_URL", "CONFLUENCE_EMAIL", "CONFLUENCE_API_TOKEN"],
+        "required_vars": ("CONFLUENCE_SITE_URL", "CONFLUENCE_EMAIL", "CONFLUENCE_API_TOKEN"),
         "url_var": "CONFLUENCE_SITE_URL",
         "prompts": {
             "CONFLUENCE_SITE_URL": {
@@ -42,7 +67,7 @@ PLATFORM_CONFIGS = {
     },
     "jira": {
         "title": "JIRA Configuration",
-        "required_vars": ["JIRA_SITE_URL", "JIRA_EMAIL", "JIRA_API_TOKEN"],
+        "required_vars": ("JIRA_SITE_URL", "JIRA_EMAIL", "JIRA_API_TOKEN"),
         "url_var": "JIRA_SITE_URL",
         "prompts": {
             "JIRA_SITE_URL": {
@@ -64,7 +89,7 @@ PLATFORM_CONFIGS = {
     },
     "splunk": {
         "title": "Splunk Configuration",
-        "required_vars": ["SPLUNK_SITE_URL", "SPLUNK_USERNAME", "SPLUNK_PASSWORD"],
+        "required_vars": ("SPLUNK_SITE_URL", "SPLUNK_USERNAME", "SPLUNK_PASSWORD"),
         "url_var": "SPLUNK_SITE_URL",
         "prompts": {
             "SPLUNK_SITE_URL": {
@@ -86,8 +111,8 @@ PLATFORM_CONFIGS = {
         "title": "GitLab Configuration",
         "installation_type": "cli",  # CLI-based platform (uses glab)
         "cli_name": "glab",
-        "required_vars": ["GITLAB_TOKEN"],
-        "optional_vars": ["GITLAB_HOST"],  # Optional for gitlab.com users
+        "required_vars": ("GITLAB_TOKEN",),
+        "optional_vars": ("GITLAB_HOST",),  # Optional for gitlab.com users
         "url_var": "GITLAB_HOST",
         "prompts": {
             "GITLAB_HOST": {
@@ -105,7 +130,7 @@ PLATFORM_CONFIGS = {
             },
         },
     },
-}
+})
 
 
 def validate_atlassian_url(url: str) -> tuple[bool, str]:
@@ -123,8 +148,7 @@ def validate_atlassian_url(url: str) -> tuple[bool, str]:
         return False, "Must be an Atlassian Cloud URL (*.atlassian.net)"
 
     # Basic URL format
-    pattern = r"^https://[a-zA-Z0-9-]+\.atlassian\.net$"
-    if not re.match(pattern, url):
+    if not _ATLASSIAN_URL_RE.fullmatch(url):
         return False, "Invalid Atlassian URL format"
 
     return True, url
@@ -139,8 +163,7 @@ def validate_url(url: str) -> tuple[bool, str]:
     if not url.startswith("http"):
         url = f"https://{url}"
 
-    pattern = r"^https?://[a-zA-Z0-9.-]+(?::\d+)?(?:/.*)?$"
-    if not re.match(pattern, url):
+    if not _URL_RE.fullmatch(url):
         return False, "Invalid URL format"
 
     return True, url
@@ -152,8 +175,13 @@ def validate_email(email: str) -> tuple[bool, str]:
         return False, "Email is required"
 
     email = email.strip().lower()
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    if not re.match(pattern, email):
+
+    # Cheap structural checks before running the regex
+    at = email.find("@")
+    if at < 1 or email.count("@") != 1 or "." not in email[at + 1:]:
+        return False, "Invalid email format"
+
+    if not _EMAIL_RE.fullmatch(email):
         return False, "Invalid email format"
 
     return True, email
@@ -166,6 +194,44 @@ VALIDATORS = {
 }
 
 
+@dataclass(frozen=True)
+class PromptSpec:
+    """Flattened prompt settings for a single credential variable."""
+
+    var_name: str
+    label: str
+    placeholder: str = ""
+    validator: Optional[Callable[[str], tuple[bool, str]]] = None
+    hidden: bool = False
+    help_text: Optional[str] = None
+    is_optional: bool = False
+    config_default: str = ""
+
+
+def _compile_prompts(prompts: dict) -> tuple[PromptSpec, ...]:
+    """Resolve a platform's prompt dicts into PromptSpec instances."""
+    return tuple(
+        PromptSpec(
+            var_name=var_name,
+            label=prompt_config["label"],
+            placeholder=prompt_config.get("placeholder", ""),
+            validator=VALIDATORS.get(prompt_config.get("validator")),
+            hidden=prompt_config.get("hidden", False),
+            help_text=prompt_config.get("help"),
+            is_optional=prompt_config.get("optional", False),
+            config_default=prompt_config.get("default", ""),
+        )
+        for var_name, prompt_config in prompts.items()
+    )
+
+
+# Prompt specs per platform, built once at import
+_COMPILED_PROMPTS = MappingProxyType({
+    platform: _compile_prompts(config["prompts"])
+    for platform, config in PLATFORM_CONFIGS.items()
+})
+
+
 def collect_credentials(platform: str, existing_env: dict, sources: list = None) -> dict:
     """
     Collect credentials for a platform interactively.
@@ -181,75 +247,81 @@ def collect_credentials(platform: str, existing_env: dict, sources: list = None)
     Returns:
         Dictionary of collected credential variables
     """
-    config = PLATFORM_CONFIGS[platform]
     credentials = {}
+    resolved = merge_env_sources(sources) if sources else {}
 
-    for var_name, prompt_config in config["prompts"].items():
-        label = prompt_config["label"]
+    for spec in _COMPILED_PROMPTS[platform]:
+        var_name = spec.var_name
+        label = spec.label
+        hidden = spec.hidden
 
         # Skip prompting if variable is already set in any source
-        if sources:
-            value, source_label = resolve_env_var(var_name, sources)
-            if value:
-                hidden = prompt_config.get("hidden", False)
-                if value.startswith("$(") and value.endswith(")"):
-                    console.print(f"  {label}: [green]****[/green] [dim](keychain via {source_label})[/dim]")
-                elif hidden:
-                    console.print(f"  {label}: [green]{mask_value(value)}[/green] [dim](from {source_label})[/dim]")
-                else:
-                    console.print(f"  {label}: [green]{value}[/green] [dim](from {source_label})[/dim]")
-                credentials[var_name] = value
-                continue
-        placeholder = prompt_config.get("placeholder", "")
-        validator_name = prompt_config.get("validator")
-        hidden = prompt_config.get("hidden", False)
-        help_text = prompt_config.get("help")
-        is_optional = prompt_config.get("optional", False)
-        config_default = prompt_config.get("default", "")
+        if var_name in resolved:
+            value, source_label = resolved[var_name]
+            if value.startswith("$(") and value.endswith(")"):
+                console.print(f"  {label}: [green]****[/green] [dim](keychain via {source_label})[/dim]")
+            elif hidden:
+                console.print(f"  {label}: [green]{mask_value(value)}[/green] [dim](from {source_label})[/dim]")
+            else:
+                console.print(f"  {label}: [green]{value}[/green] [dim](from {source_label})[/dim]")
+            credentials[var_name] = value
+            continue
 
         # Get default from existing env, falling back to config default
-        default = existing_env.get(var_name, "") or config_default
+        default = existing_env.get(var_name, "") or spec.config_default
 
         # Show help text if available
-        if help_text:
-            console.print(f"  [dim]{help_text}[/dim]")
+        if spec.help_text:
+            console.print(f"  [dim]{spec.help_text}[/dim]")
 
         # Build prompt text
         if default and not hidden:
             prompt_text = f"  {label} [{default}]"
-        elif placeholder:
-            prompt_text = f"  {label} [{placeholder}]"
+        elif spec.placeholder:
+            prompt_text = f"  {label} [{spec.placeholder}]"
         else:
             prompt_text = f"  {label}"
 
+        # Build the prompt once per field so Rich parses its markup once,
+        # not on every retry
+        if hidden:
+            hidden_label = f"  {label} (hidden): "
+        else:
+            field_prompt = Prompt(prompt_text)
+
         # Collect input
         while True:
             if hidden:
-                # Use getpass for hidden input
-                console.print(f"  {label} (hidden): ", end="")
-                value = getpass("")
+                # Use getpass for hidden input; read piped stdin directly
+                console.print(hidden_label, end="")
+                if sys.stdin.isatty():
+                    value = getpass("")
+                else:
+                    value = sys.stdin.readline()
+                    if not value:
+                        # EOF - getpass would raise here too
+                        raise EOFError
+                    value = value.rstrip("\n")
                 if not value and default:
                     value = default
             else:
-                value = Prompt.ask(prompt_text, default=default or "")
+                value = field_prompt(default=default or "")
 
             # Handle optional fields with defaults
             if not value:
-                if is_optional and config_default:
-                    value = config_default
-                elif not is_optional:
-                    console.print("    [red]Value required[/red]")
+                if spec.is_optional and spec.config_default:
+                    value = spec.config_default
+                elif not spec.is_optional:
+                    console.print(_VALUE_REQUIRED)
                     continue
 
             # Validate if validator specified and we have a value
-            if value and validator_name:
-                validator = VALIDATORS.get(validator_name)
-                if validator:
-                    valid, result = validator(value)
-                    if not valid:
-                        console.print(f"    [red]{result}[/red]")
-                        continue
-                    value = result  # Use normalized value
+            if value and spec.validator:
+                valid, result = spec.validator(value)
+                if not valid:
+                    console.print(f"    [red]{result}[/red]")
+                    continue
+                value = result  # Use normalized value
 
             break
 
@@ -14,10 +14,20 @@ from pathlib import Path
 from typing import Optional
 
 
+# KEY=value line (value may be quoted)
+_ENV_LINE_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_]*)=(.*)")
+
+# Parsed env files keyed by path, tagged with the (mtime_ns, size) they were read at
+_env_cache: dict[Path, tuple[tuple[int, int], dict]] = {}
+
+
 def load_env_file(path: Path) -> dict:
     """
     Load environment variables from a file.
 
+    Results are cached per path and reused while the file's mtime and
+    size are unchanged.
+
     Args:
         path: Path to the .env file
 
@@ -26,22 +36,31 @@ def load_env_file(path: Path) -> dict:
     """
     env_vars = {}
 
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except OSError:
         return env_vars
 
+    stat_key = (stat.st_mtime_ns, stat.st_size)
+    cached = _env_cache.get(path)
+    if cached and cached[0] == stat_key:
+        return dict(cached[1])
+
     try:
-        content = path.read_text()
+        # Parse line by line rather than reading the whole file first
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
 
-        for line in content.splitlines():
-            line = line.strip()
+                # Skip comments and empty lines
+                if not line or line.startswith("#"):
+                    continue
 
-            # Skip comments and empty lines
-            if not line or line.startswith("#"):
-                continue
+                # Parse KEY=value or KEY="value" or KEY='value'
+                match = _ENV_LINE_RE.fullmatch(line)
+                if not match:
+                    continue
 
-            # Parse KEY=value or KEY="value" or KEY='value'
-            match = re.match(r'^([A-Za-z_][A-Za-z0-9_]*)=(.*)$', line)
-            if match:
                 key = match.group(1)
                 value = match.group(2)
 
@@ -55,7 +74,8 @@ def load_env_file(path: Path) -> dict:
     except Exception:
         pass
 
-    return env_vars
+    _env_cache[path] = (stat_key, env_vars)
+    return dict(env_vars)
 
 
 def save_env_file(path: Path, env_vars: dict) -> Optional[Path]:
@@ -196,6 +216,27 @@ def resolve_env_var(name: str, sources: list[tuple[str, dict]]) -> tuple[str, st
     return "", ""
 
 
+def merge_env_sources(sources: list[tuple[str, dict]]) -> dict[str, tuple[str, str]]:
+    """
+    Flatten prioritized sources into a single lookup table.
+
+    Equivalent to calling resolve_env_var for every name, but walks
+    the sources only once.
+
+    Args:
+        sources: Ordered list of (label, env_dict) tuples
+
+    Returns:
+        Dictionary of name -> (value, source_label) for non-empty values
+    """
+    merged = {}
+    for label, env_dict in reversed(sources):
+        for name, value in env_dict.items():
+            if value:
+                merged[name] = (value, label)
+    return merged
+
+
 def discover_env_files() -> list[tuple[str, Path]]:
     """
     Discover env files that exist on disk.
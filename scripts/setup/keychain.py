@@ -4,19 +4,27 @@ OS Keychain integration for AS-Plugins Setup Wizard.
 
 Provides secure credential storage using:
 - macOS: security command (Keychain Access)
-- Linux: secret-tool (GNOME Keyring / libsecret)
+- Linux: secretstorage (direct D-Bus) when installed, otherwise
+  secret-tool (GNOME Keyring / libsecret)
 
 This is optional functionality - credentials can also be stored
 in ~/.env file directly.
 """
 
+import functools
+import shutil
 import subprocess
 import sys
 from typing import Optional
 
+try:
+    import secretstorage
+except ImportError:  # Optional - fall back to the secret-tool CLI
+    secretstorage = None
 
-def get_platform() -> str:
-    """Get the current platform."""
+
+def _detect_platform() -> str:
+    """Map sys.platform to a keychain backend name."""
     if sys.platform == "darwin":
         return "macos"
     elif sys.platform.startswith("linux"):
@@ -25,33 +33,61 @@ def get_platform() -> str:
         return "unsupported"
 
 
+# sys.platform cannot change during a run, so resolve it once
+_PLATFORM = _detect_platform()
+
+
+def get_platform() -> str:
+    """Get the current platform."""
+    return _PLATFORM
+
+
+@functools.lru_cache(maxsize=1)
+def _get_collection():
+    """
+    Open the default Secret Service collection once per run (Linux only).
+
+    Returns:
+        A secretstorage Collection, or None if secretstorage is not
+        installed, the Secret Service is unreachable, or the collection
+        could not be unlocked
+    """
+    if _PLATFORM != "linux" or secretstorage is None:
+        return None
+
+    try:
+        bus = secretstorage.dbus_init()
+        collection = secretstorage.get_default_collection(bus)
+        if collection.is_locked():
+            # unlock() returns True if the user dismissed the prompt; let
+            # secret-tool handle the keyring instead
+            if collection.unlock() or collection.is_locked():
+                return None
+        return collection
+    except Exception:
+        return None
+
+
+def _attributes(service: str, account: str) -> dict:
+    """Lookup attributes shared by secretstorage and secret-tool."""
+    return {"service": service, "account": account}
+
+
+@functools.lru_cache(maxsize=1)
 def is_keychain_available() -> bool:
-    """Check if OS keychain is available."""
-    platform = get_platform()
+    """
+    Check if OS keychain is available.
 
-    if platform == "macos":
+    Only looks for the backend CLI on PATH (no process spawn), and the
+    result is cached for the lifetime of the wizard.
+    """
+    if _PLATFORM == "macos":
         # Check for security command
-        try:
-            subprocess.run(
-                ["security", "help"],
-                capture_output=True,
-                check=False,
-            )
-            return True
-        except FileNotFoundError:
-            return False
+        return shutil.which("security") is not None
 
-    if platform == "linux":
-        # Check for secret-tool
-        try:
-            subprocess.run(
-                ["secret-tool", "--version"],
-                capture_output=True,
-                check=False,
-            )
-            return True
-        except FileNotFoundError:
-            return False
+    if _PLATFORM == "linux":
+        # Check for secret-tool, then a direct D-Bus connection
+        return shutil.which("secret-tool") is not None or _get_collection() is not None
 
     return False
 
@@ -68,9 +104,7 @@ def store_secret(service: str, account: str, secret: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    platform = get_platform()
-
-    if platform == "macos":
+    if _PLATFORM == "macos":
         try:
             # Delete existing entry first (ignore errors)
             subprocess.run(
@@ -80,7 +114,8 @@ def store_secret(service: str, account: str, secret: str) -> bool:
                     "-s", service,
                     "-a", account,
                 ],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=False,
             )
 
@@ -94,14 +129,28 @@ def store_secret(service: str, account: str, secret: str) -> bool:
                     "-w", secret,
                     "-U",  # Update if exists
                 ],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=True,
             )
             return True
         except subprocess.CalledProcessError:
             return False
 
-    if platform == "linux":
+    if _PLATFORM == "linux":
+        collection = _get_collection()
+        if collection is not None:
+            try:
+                collection.create_item(
+                    f"{service} - {account}",
+                    _attributes(service, account),
+                    secret.encode(),
+                    replace=True,
+                )
+                return True
+            except Exception:
+                return False
+
         try:
             # Store using secret-tool
             process = subprocess.Popen(
@@ -113,7 +162,8 @@ def store_secret(service: str, account: str, secret: str) -> bool:
                     "account", account,
                 ],
                 stdin=subprocess.PIPE,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
             process.communicate(input=secret.encode())
             return process.returncode == 0
@@ -134,9 +184,7 @@ def get_secret(service: str, account: str) -> Optional[str]:
     Returns:
         The secret value if found, None otherwise
     """
-    platform = get_platform()
-
-    if platform == "macos":
+    if _PLATFORM == "macos":
         try:
             result = subprocess.run(
                 [
@@ -154,7 +202,15 @@ def get_secret(service: str, account: str) -> Optional[str]:
         except subprocess.CalledProcessError:
             return None
 
-    if platform == "linux":
+    if _PLATFORM == "linux":
+        collection = _get_collection()
+        if collection is not None:
+            try:
+                item = next(collection.search_items(_attributes(service, account)), None)
+                return item.get_secret().decode() if item else None
+            except Exception:
+                return None
+
         try:
             result = subprocess.run(
                 [
@@ -185,9 +241,7 @@ def delete_secret(service: str, account: str) -> bool:
     Returns:
         True if successful or not found, False on error
     """
-    platform = get_platform()
-
-    if platform == "macos":
+    if _PLATFORM == "macos":
         try:
             subprocess.run(
                 [
@@ -196,7 +250,8 @@ def delete_secret(service: str, account: str) -> bool:
                     "-s", service,
                     "-a", account,
                 ],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=True,
             )
             return True
@@ -204,7 +259,16 @@ def delete_secret(service: str, account: str) -> bool:
             # Not found is OK
             return True
 
-    if platform == "linux":
+    if _PLATFORM == "linux":
+        collection = _get_collection()
+        if collection is not None:
+            try:
+                for item in collection.search_items(_attributes(service, account)):
+                    item.delete()
+                return True
+            except Exception:
+                return False
+
         try:
             subprocess.run(
                 [
@@ -213,7 +277,8 @@ def delete_secret(service: str, account: str) -> bool:
                     "service", service,
                     "account", account,
                 ],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=True,
             )
             return True
@@ -6,45 +6,120 @@ Interactive setup for Assistant Skills Claude Code plugins with
 Confluence, JIRA, and Splunk integration.
 """
 
+import functools
+import importlib.metadata
 import os
+import re
+import subprocess
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Optional
 
-from rich.console import Console
-from rich.panel import Panel
+from rich.console import Console, Group
+from rich.markup import escape
 from rich.prompt import Prompt, Confirm
-from rich.table import Table
-from rich import box
 
 from .credentials import collect_credentials, PLATFORM_CONFIGS
-from .validate import validate_credentials
+from . import validation_cache
 from .env_file import load_env_file, save_env_file, mask_value, discover_env_files
 from .plugins import (
     check_claude_cli,
     check_cli_installed,
-    check_marketplace_added,
     add_marketplace,
     detect_os,
     get_cli_install_instructions,
-    install_plugin,
+    install_plugins_batch,
     get_installed_plugins,
+    get_plugin_state,
 )
 
-console = Console()
+# soft_wrap: let the terminal wrap long lines instead of re-measuring each print
+console = Console(soft_wrap=True)
 
 # Environment variables from bash wrapper
-REPO_DIR = Path(os.environ.get("AS_PLUGINS_REPO_DIR", Path(__file__).parent.parent.parent))
-VENV_DIR = Path(os.environ.get("AS_PLUGINS_VENV_DIR", REPO_DIR / ".venv"))
 SKIP_PLUGINS = os.environ.get("AS_PLUGINS_SKIP_PLUGINS", "false").lower() == "true"
 NO_KEYCHAIN = os.environ.get("AS_PLUGINS_NO_KEYCHAIN", "false").lower() == "true"
 PLATFORMS_ARG = os.environ.get("AS_PLUGINS_PLATFORMS", "")
 VALIDATE_ONLY = os.environ.get("AS_PLUGINS_VALIDATE_ONLY", "false").lower() == "true"
 SKIP_CREDENTIALS = os.environ.get("AS_PLUGINS_SKIP_CREDENTIALS", "false").lower() == "true"
+SKIP_REUSE_VALIDATION = os.environ.get("AS_PLUGINS_SKIP_REUSE_VALIDATION", "false").lower() == "true"
 
 # Check if stdin is a TTY (interactive mode)
 IS_INTERACTIVE = sys.stdin.isatty()
 
-ENV_FILE = Path.home() / ".env"
+# Claude Code plugin per platform
+PLUGIN_NAMES = {
+    "confluence": "confluence-assistant-skills",
+    "jira": "jira-assistant-skills",
+    "splunk": "splunk-assistant-skills",
+    "gitlab": "gitlab-assistant-skills",
+}
+
+# Python library (name, minimum version) per platform
+PIP_PACKAGES = {
+    "confluence": ("confluence-as", "1.1.0"),
+    "jira": ("jira-as", "1.1.1"),
+    "splunk": ("splunk-as", "1.2.0"),
+    # gitlab: no Python package needed (uses glab CLI)
+}
+
+# Lines of pip output kept for display when an install fails
+PIP_OUTPUT_TAIL = 50
+
+VALID_PLATFORMS = frozenset(PLATFORM_CONFIGS)
+
+# Display order and labels for platform lists
+PLATFORM_ORDER = ("confluence", "jira", "splunk", "gitlab")
+PLATFORM_LABELS = {platform: platform.capitalize() for platform in PLATFORM_ORDER}
+
+# Leading http:// or https:// on a site URL
+_SCHEME_RE = re.compile(r"^https?://")
+
+# Required variables per platform, as sets for subset checks
+PLATFORM_REQUIRED_SETS = {
+    platform: frozenset(config["required_vars"])
+    for platform, config in PLATFORM_CONFIGS.items()
+}
+
+# Flattened per-platform settings, so call sites use attribute access
+# instead of chained PLATFORM_CONFIGS[...].get(...) lookups
+_PLATFORM = {
+    platform: SimpleNamespace(
+        title=config.get("title", platform),
+        url_var=config.get("url_var", ""),
+        cli_name=config.get("cli_name"),
+        installation_type=config.get("installation_type"),
+        required_vars=tuple(config.get("required_vars", ())),
+        optional_vars=tuple(config.get("optional_vars", ())),
+    )
+    for platform, config in PLATFORM_CONFIGS.items()
+}
+
+
+@functools.cache
+def _repo_dir() -> Path:
+    """Repository root (from the bash wrapper, or relative to this file)."""
+    return Path(os.environ.get("AS_PLUGINS_REPO_DIR", Path(__file__).parent.parent.parent))
+
+
+@functools.cache
+def _venv_dir() -> Path:
+    """Virtualenv used for Python libraries (from the bash wrapper)."""
+    return Path(os.environ.get("AS_PLUGINS_VENV_DIR", _repo_dir() / ".venv"))
+
+
+@functools.cache
+def _env_file() -> Path:
+    """The ~/.env file credentials are saved to."""
+    return Path.home() / ".env"
+
+
+def _display_host(url: str) -> str:
+    """Strip the scheme and trailing slash from a URL for display."""
+    return _SCHEME_RE.sub("", url).rstrip("/") if url else ""
 
 
 def show_welcome():
@@ -87,13 +162,13 @@ def detect_existing_config():
 
     # Determine which platforms are fully configured
     configured = {}
-    for platform, config in PLATFORM_CONFIGS.items():
-        required_vars = config["required_vars"]
-        if all(merged_env.get(var) for var in required_vars):
+    for platform, info in _PLATFORM.items():
+        required_vars = PLATFORM_REQUIRED_SETS[platform]
+        if required_vars <= merged_env.keys() and all(merged_env[var] for var in required_vars):
             # Include required vars
-            platform_config = {var: merged_env[var] for var in required_vars}
+            platform_config = {var: merged_env[var] for var in info.required_vars}
             # Also include optional vars that are present
-            for var in config.get("optional_vars", []):
+            for var in info.optional_vars:
                 if merged_env.get(var):
                     platform_config[var] = merged_env[var]
             configured[platform] = platform_config
@@ -106,13 +181,17 @@ def show_existing_config(configured: dict):
     if not configured:
         return
 
+    # Imported here to keep them off the startup path
+    from rich import box
+    from rich.table import Table
+
     console.print("[yellow]Detected existing configuration:[/yellow]")
     table = Table(box=box.SIMPLE)
     table.add_column("Platform", style="cyan")
     table.add_column("Status", style="green")
 
     for platform in configured:
-        table.add_row(platform.capitalize(), "Configured")
+        table.add_row(PLATFORM_LABELS[platform], "Configured")
 
     console.print(table)
     console.print()
@@ -126,29 +205,72 @@ def validate_existing_config(configured: dict) -> dict:
         configured: Dictionary of platform -> credentials
 
     Returns:
-        Dictionary of platform -> {"valid": bool, "message": str, "url": str}
+        Dictionary of platform -> {"valid": bool, "message": str, "url": str, "cached": bool}
     """
     status = {}
+    if not configured:
+        return status
+
+    # Reuse recent successful results for unchanged credentials
+    results = {}
+    for platform, creds in configured.items():
+        cached = validation_cache.lookup(platform, creds)
+        if cached:
+            results[platform] = cached
+    from_cache = set(results)
+
+    # Each check is a blocking HTTPS round-trip, so run them concurrently
+    to_check = [p for p in configured if p not in results]
+    if to_check:
+        # Deferred: requests is the slowest import, and is not needed when
+        # every result comes from the cache
+        from .validate import validate_all
+
+        for platform, result in validate_all({p: configured[p] for p in to_check}).items():
+            results[platform] = result
+            validation_cache.record(platform, configured[platform], *result)
+        validation_cache.save()
 
     for platform, creds in configured.items():
-        success, message = validate_credentials(platform, creds)
+        success, message = results[platform]
 
         # Extract URL for display
-        config = PLATFORM_CONFIGS.get(platform, {})
-        url_var = config.get("url_var", "")
-        url = creds.get(url_var, "")
-        if url:
-            url = url.replace("https://", "").replace("http://", "").rstrip("/")
+        url = _display_host(creds.get(_PLATFORM[platform].url_var, ""))
 
         status[platform] = {
             "valid": success,
             "message": message,
             "url": url,
+            "cached": platform in from_cache,
         }
 
     return status
 
 
+def _render_validation_row(platform: str, validation_status: dict, valid_text: Optional[str] = None) -> str:
+    """
+    Format one platform's validation status line.
+
+    Args:
+        platform: Platform name
+        validation_status: Results from validate_existing_config
+        valid_text: Text shown for valid platforms (defaults to the validation message)
+
+    Returns:
+        Rich markup line for the platform
+    """
+    label = PLATFORM_LABELS[platform]
+    status = validation_status.get(platform)
+    if status is None:
+        return f"  [dim]○[/dim] {label}: (not configured)"
+
+    url_info = f" ({status['url']})" if status["url"] else ""
+    if status["valid"]:
+        cached_info = " [dim](cached)[/dim]" if status.get("cached") else ""
+        return f"  [green]✓[/green] {label}: {valid_text or status['message']}{url_info}{cached_info}"
+    return f"  [red]✗[/red] {label}: {status['message']}{url_info}"
+
+
 def show_validation_results(validation_status: dict, configured: dict) -> bool:
     """
     Display validation results for --validate-only mode.
@@ -160,40 +282,24 @@ def show_validation_results(validation_status: dict, configured: dict) -> bool:
     Returns:
         True if all configured platforms are valid
     """
-    console.print("[bold]Validating existing configuration...[/bold]")
-    console.print()
+    # Build the whole report first and print it in one call
+    lines = ["[bold]Validating existing configuration...[/bold]", ""]
+    lines.extend(_render_validation_row(platform, validation_status) for platform in PLATFORM_ORDER)
+    lines.append("")
 
-    all_platforms = ["confluence", "jira", "splunk", "gitlab"]
-    all_valid = True
-    any_configured = False
-
-    for platform in all_platforms:
-        if platform in validation_status:
-            any_configured = True
-            status = validation_status[platform]
-            url_info = f" ({status['url']})" if status["url"] else ""
-
-            if status["valid"]:
-                console.print(f"  [green]✓[/green] {platform.capitalize()}: {status['message']}{url_info}")
-            else:
-                console.print(f"  [red]✗[/red] {platform.capitalize()}: {status['message']}{url_info}")
-                all_valid = False
-        else:
-            console.print(f"  [dim]○[/dim] {platform.capitalize()}: (not configured)")
-
-    console.print()
+    any_configured = bool(validation_status)
+    all_valid = any_configured and all(status["valid"] for status in validation_status.values())
 
     if not any_configured:
-        console.print("[yellow]No platforms configured.[/yellow]")
-        console.print("Run setup.sh without --validate-only to configure credentials.")
-        return False
-
-    if all_valid:
-        console.print("[green]All configured platforms are valid.[/green]")
+        lines.append("[yellow]No platforms configured.[/yellow]")
+        lines.append("Run setup.sh without --validate-only to configure credentials.")
+    elif all_valid:
+        lines.append("[green]All configured platforms are valid.[/green]")
     else:
-        console.print("[yellow]Some credentials need to be updated.[/yellow]")
-        console.print("Run setup.sh to reconfigure invalid credentials.")
+        lines.append("[yellow]Some credentials need to be updated.[/yellow]")
+        lines.append("Run setup.sh to reconfigure invalid credentials.")
 
+    console.print("\n".join(lines))
     return all_valid
 
 
@@ -214,31 +320,23 @@ def select_platforms_with_status(configured: dict, validation_status: dict) -> t
     # If platforms specified via command line, use those
     if PLATFORMS_ARG:
         platforms = [p.strip().lower() for p in PLATFORMS_ARG.split(",")]
-        valid = [p for p in platforms if p in PLATFORM_CONFIGS]
+        valid = [p for p in platforms if p in VALID_PLATFORMS]
         if valid:
             return valid, False
 
     # Check if we have any valid existing config
     valid_platforms = [p for p, s in validation_status.items() if s["valid"]]
     invalid_platforms = [p for p, s in validation_status.items() if not s["valid"]]
-    unconfigured = [p for p in PLATFORM_CONFIGS.keys() if p not in configured]
-
-    # Show current status
-    console.print("[bold]Validating existing configuration...[/bold]")
-
-    all_platforms = ["confluence", "jira", "splunk", "gitlab"]
-    for platform in all_platforms:
-        if platform in validation_status:
-            status = validation_status[platform]
-            url_info = f" ({status['url']})" if status["url"] else ""
-            if status["valid"]:
-                console.print(f"  [green]✓[/green] {platform.capitalize()}: Valid{url_info}")
-            else:
-                console.print(f"  [red]✗[/red] {platform.capitalize()}: {status['message']}{url_info}")
-        else:
-            console.print(f"  [dim]○[/dim] {platform.capitalize()}: (not configured)")
+    unconfigured = [p for p in PLATFORM_ORDER if p not in configured]
 
-    console.print()
+    # Show current status in one write
+    lines = ["[bold]Validating existing configuration...[/bold]"]
+    lines.extend(
+        _render_validation_row(platform, validation_status, valid_text="Valid")
+        for platform in PLATFORM_ORDER
+    )
+    lines.append("")
+    console.print("\n".join(lines))
 
     # If all existing configs are invalid, go straight to configuration
     if configured and not valid_platforms:
@@ -246,61 +344,31 @@ def select_platforms_with_status(configured: dict, validation_status: dict) -> t
         console.print()
         return list(configured.keys()), False
 
-    # Build menu options
-    options = []
-    option_map = {}
-
-    # Option 1: Keep existing (only if we have valid platforms)
-    if valid_platforms:
-        options.append("  [1] Keep existing config, install packages/plugins only (Recommended)")
-        option_map["1"] = ("keep", valid_platforms)
-
-    # Option 2+: Reconfigure specific invalid platforms
-    next_opt = 2
-    if invalid_platforms:
-        for platform in invalid_platforms:
-            options.append(f"  [{next_opt}] Reconfigure {platform.capitalize()}")
-            option_map[str(next_opt)] = ("reconfigure", [platform])
-            next_opt += 1
-
-    # Option: Add unconfigured platforms
-    if unconfigured:
-        for platform in unconfigured:
-            options.append(f"  [{next_opt}] Add {platform.capitalize()}")
-            option_map[str(next_opt)] = ("add", [platform])
-            next_opt += 1
-
-    # Option: Reconfigure all
+    # Build menu options as (label, action, platforms), numbered from 1
     if configured:
-        options.append(f"  [{next_opt}] Reconfigure all platforms")
-        option_map[str(next_opt)] = ("reconfigure_all", list(configured.keys()))
-        next_opt += 1
-
-    # Option: Configure from scratch
-    if not configured:
-        options.append("  [1] Configure Confluence + JIRA (Atlassian Cloud)")
-        options.append("  [2] Configure all platforms (Confluence + JIRA + Splunk + GitLab)")
-        options.append("  [3] Configure Confluence only")
-        options.append("  [4] Configure JIRA only")
-        options.append("  [5] Configure Splunk only")
-        options.append("  [6] Configure GitLab only")
-        option_map = {
-            "1": ("configure", ["confluence", "jira"]),
-            "2": ("configure", ["confluence", "jira", "splunk", "gitlab"]),
-            "3": ("configure", ["confluence"]),
-            "4": ("configure", ["jira"]),
-            "5": ("configure", ["splunk"]),
-            "6": ("configure", ["gitlab"]),
-        }
-        next_opt = 7
-
-    console.print("[bold]What would you like to do?[/bold]")
-    for opt in options:
-        console.print(opt)
-    console.print()
-
-    valid_choices = list(option_map.keys())
-    choice = Prompt.ask("Select", choices=valid_choices, default="1")
+        options = []
+        if valid_platforms:
+            options.append(("Keep existing config, install packages/plugins only (Recommended)", "keep", valid_platforms))
+        options.extend((f"Reconfigure {PLATFORM_LABELS[p]}", "reconfigure", [p]) for p in invalid_platforms)
+        options.extend((f"Add {PLATFORM_LABELS[p]}", "add", [p]) for p in unconfigured)
+        options.append(("Reconfigure all platforms", "reconfigure_all", list(configured.keys())))
+    else:
+        options = [
+            ("Configure Confluence + JIRA (Atlassian Cloud)", "configure", ["confluence", "jira"]),
+            ("Configure all platforms (Confluence + JIRA + Splunk + GitLab)", "configure", list(PLATFORM_ORDER)),
+            ("Configure Confluence only", "configure", ["confluence"]),
+            ("Configure JIRA only", "configure", ["jira"]),
+            ("Configure Splunk only", "configure", ["splunk"]),
+            ("Configure GitLab only", "configure", ["gitlab"]),
+        ]
+    option_map = {str(i + 1): (action, platforms) for i, (_, action, platforms) in enumerate(options)}
+
+    lines = ["[bold]What would you like to do?[/bold]"]
+    lines.extend(f"  [{i + 1}] {label}" for i, (label, _, _) in enumerate(options))
+    lines.append("")
+    console.print("\n".join(lines))
+
+    choice = Prompt.ask("Select", choices=list(option_map), default="1")
     action, platforms = option_map[choice]
 
     if action == "keep":
@@ -315,7 +383,7 @@ def select_platforms(configured: dict) -> list[str]:
     # If platforms specified via command line
     if PLATFORMS_ARG:
         platforms = [p.strip().lower() for p in PLATFORMS_ARG.split(",")]
-        valid = [p for p in platforms if p in PLATFORM_CONFIGS]
+        valid = [p for p in platforms if p in VALID_PLATFORMS]
         if valid:
             return valid
 
@@ -331,7 +399,7 @@ def select_platforms(configured: dict) -> list[str]:
 
     choices = {
         "1": ["confluence", "jira"],
-        "2": ["confluence", "jira", "splunk", "gitlab"],
+        "2": list(PLATFORM_ORDER),
         "3": ["confluence"],
         "4": ["jira"],
         "5": ["splunk"],
@@ -342,6 +410,28 @@ def select_platforms(configured: dict) -> list[str]:
     return choices[choice]
 
 
+def probe_platform_clis(platforms: list[str]):
+    """
+    Look up the CLI tools required by the selected platforms, concurrently.
+
+    Warms check_cli_installed's cache so later prerequisite checks are
+    plain dictionary lookups.
+
+    Args:
+        platforms: Selected platform names
+    """
+    cli_names = {
+        _PLATFORM[p].cli_name
+        for p in platforms
+        if _PLATFORM[p].installation_type == "cli"
+    } - {None}
+    if not cli_names:
+        return
+
+    with ThreadPoolExecutor(max_workers=len(cli_names)) as executor:
+        list(executor.map(check_cli_installed, cli_names))
+
+
 def check_platform_prerequisites(platform: str) -> tuple[bool, str]:
     """
     Check if platform prerequisites are met (e.g., CLI tools installed).
@@ -352,11 +442,11 @@ def check_platform_prerequisites(platform: str) -> tuple[bool, str]:
     Returns:
         Tuple of (success, error_message). If success is True, error_message is empty.
     """
-    config = PLATFORM_CONFIGS.get(platform, {})
+    info = _PLATFORM.get(platform)
 
     # Check CLI-based platforms for required CLI tool
-    if config.get("installation_type") == "cli":
-        cli_name = config.get("cli_name")
+    if info and info.installation_type == "cli":
+        cli_name = info.cli_name
         if cli_name and not check_cli_installed(cli_name):
             os_type = detect_os()
             instructions = get_cli_install_instructions(cli_name)
@@ -389,83 +479,122 @@ def show_cli_install_instructions(cli_name: str):
     console.print()
 
 
-def install_python_packages(platforms: list[str]):
-    """Install Python packages for selected platforms."""
-    console.print()
-    console.print("[bold]Installing Python Libraries[/bold]")
+def _version_tuple(version: str) -> Optional[tuple[int, ...]]:
+    """Parse a plain release version like "1.2.0"; None for anything else."""
+    parts = version.split(".")
+    if not all(part.isdigit() for part in parts):
+        return None
+    return tuple(int(part) for part in parts)
 
-    packages = {
-        "confluence": ("confluence-as", "1.1.0"),
-        "jira": ("jira-as", "1.1.1"),
-        "splunk": ("splunk-as", "1.2.0"),
-        # gitlab: no Python package needed (uses glab CLI)
-    }
 
-    import subprocess
+def _is_installed(pkg_name: str, min_version: str) -> bool:
+    """
+    Check whether the wizard's own environment already satisfies pkg>=min_version.
+
+    Only trusted when the wizard runs inside the venv (as setup.sh does);
+    pre-release or unusual versions are left for pip to decide.
+    """
+    if Path(sys.prefix).resolve() != _venv_dir().resolve():
+        return False
+
+    try:
+        installed = _version_tuple(importlib.metadata.version(pkg_name))
+    except importlib.metadata.PackageNotFoundError:
+        return False
+
+    required = _version_tuple(min_version)
+    return installed is not None and required is not None and installed >= required
+
 
-    pip_path = VENV_DIR / "bin" / "pip"
+def install_python_packages(platforms: list[str]):
+    """Install Python packages for selected platforms."""
+    console.print("\n[bold]Installing Python Libraries[/bold]")
 
+    pip_path = _venv_dir() / "bin" / "pip"
+
+    requirements = []
     for platform in platforms:
-        config = PLATFORM_CONFIGS.get(platform, {})
+        info = _PLATFORM.get(platform)
 
         # Skip CLI-based platforms (they don't need Python packages)
-        if config.get("installation_type") == "cli":
-            cli_name = config.get("cli_name", "CLI")
-            console.print(f"  {platform} [dim](uses {cli_name} CLI)[/dim]")
+        if info and info.installation_type == "cli":
+            console.print(f"  {platform} [dim](uses {info.cli_name or 'CLI'} CLI)[/dim]")
             continue
 
-        if platform in packages:
-            pkg_name, version = packages[platform]
-            console.print(f"  {pkg_name} {version} ... ", end="")
-            try:
-                result = subprocess.run(
-                    [str(pip_path), "install", f"{pkg_name}>={version}"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                console.print("[green]OK[/green]")
-            except subprocess.CalledProcessError as e:
-                console.print(f"[red]FAILED[/red]")
-                console.print(f"[dim]{e.stderr}[/dim]")
-
-
-def install_claude_plugins(platforms: list[str]):
-    """Install Claude Code plugins for selected platforms."""
-    if SKIP_PLUGINS:
-        console.print()
-        console.print("[dim]Skipping Claude Code plugin installation (--skip-plugins)[/dim]")
+        if platform in PIP_PACKAGES:
+            pkg_name, version = PIP_PACKAGES[platform]
+            if _is_installed(pkg_name, version):
+                console.print(f"  {pkg_name} {version} ... [dim]already installed[/dim]")
+            else:
+                requirements.append((pkg_name, version))
+
+    if not requirements:
         return
 
-    if not check_claude_cli():
-        console.print()
-        console.print("[yellow]Claude Code CLI not available - skipping plugin installation[/yellow]")
+    # Fail early with a clear message rather than a FileNotFoundError from pip
+    if not pip_path.is_file():
+        console.print(f"  [red]pip not found at {pip_path}[/red] - skipping Python libraries")
         return
 
-    console.print()
-    console.print("[bold]Installing Claude Code Plugins[/bold]")
+    # Install everything in a single pip run (one startup, one resolve).
+    # Output is streamed and only the tail is kept, to show on failure.
+    label = ", ".join(pkg_name for pkg_name, _ in requirements)
+    tail = deque(maxlen=PIP_OUTPUT_TAIL)
+    with console.status(f"  Installing {label} ..."):
+        with subprocess.Popen(
+            [str(pip_path), "install"]
+            + [f"{pkg_name}>={version}" for pkg_name, version in requirements],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        ) as proc:
+            for line in proc.stdout:
+                tail.append(line.rstrip("\n"))
+    success = proc.returncode == 0
+    error = "" if success else "\n".join(tail)
+
+    # pip resolves the batch as a whole, so every package shares the outcome
+    status = "[green]OK[/green]" if success else "[red]FAILED[/red]"
+    rows = [f"  {pkg_name} {version} ... {status}" for pkg_name, version in requirements]
+    if error:
+        rows.append(f"[dim]{escape(error)}[/dim]")
+    console.print("\n".join(rows))
+
+
+def install_claude_plugins(platforms: list[str]) -> Optional[set[str]]:
+    """
+    Install Claude Code plugins for selected platforms.
+
+    Returns:
+        Set of installed plugin names after installation, or None if
+        plugin installation was skipped
+    """
+    if SKIP_PLUGINS:
+        console.print("\n[dim]Skipping Claude Code plugin installation (--skip-plugins)[/dim]")
+        return None
+
+    if not check_claude_cli():
+        console.print("\n[yellow]Claude Code CLI not available - skipping plugin installation[/yellow]")
+        return None
+
+    console.print("\n[bold]Installing Claude Code Plugins[/bold]")
+
+    # One snapshot covers both the marketplace check and the installed list
+    state = get_plugin_state()
+    installed = state["installed"]
 
     # Check/add marketplace
-    if not check_marketplace_added():
-        console.print("  Adding as-plugins marketplace ... ", end="")
+    if not state["marketplace_added"]:
         if add_marketplace():
-            console.print("[green]OK[/green]")
+            console.print("  Adding as-plugins marketplace ... [green]OK[/green]")
         else:
-            console.print("[red]FAILED[/red]")
-            return
-
-    # Map platforms to plugin names
-    plugin_names = {
-        "confluence": "confluence-assistant-skills",
-        "jira": "jira-assistant-skills",
-        "splunk": "splunk-assistant-skills",
-        "gitlab": "gitlab-assistant-skills",
-    }
-
-    installed = get_installed_plugins()
+            console.print("  Adding as-plugins marketplace ... [red]FAILED[/red]")
+            return None
 
+    to_install = []
     for platform in platforms:
-        plugin_name = plugin_names.get(platform)
+        plugin_name = PLUGIN_NAMES.get(platform)
         if not plugin_name:
             continue
 
@@ -474,64 +603,83 @@ def install_claude_plugins(platforms: list[str]):
             console.print(f"  {plugin_name} ... [dim]already installed[/dim]")
             continue
 
-        console.print(f"  {plugin_name} ... ", end="")
-        if install_plugin(plugin_name):
-            console.print("[green]OK[/green]")
-        else:
-            console.print("[red]FAILED[/red]")
+        to_install.append(plugin_name)
+
+    if to_install:
+        with console.status("  Installing plugins ...") as status:
+            # Show the CLI's latest progress line next to the spinner
+            results = install_plugins_batch(
+                to_install,
+                on_line=lambda line: status.update(f"  Installing plugins ... [dim]{escape(line.strip())}[/dim]"),
+            )
+
+        for plugin_name in to_install:
+            if results[plugin_name]:
+                console.print(f"  {plugin_name} ... [green]OK[/green]")
+                # Track successful installs in the returned set instead of re-listing
+                installed.add(plugin_name)
+            else:
+                console.print(f"  {plugin_name} ... [red]FAILED[/red]")
 
+    return installed
 
-def show_summary(platforms: list[str], env_vars: dict):
-    """Display setup summary."""
-    console.print()
-    console.print(Panel(
-        "[bold green]Setup Complete![/bold green]",
-        box=box.DOUBLE,
-        expand=False
-    ))
-    console.print()
 
-    # Configured platforms
-    console.print("[bold]Configured platforms:[/bold]")
+def show_summary(platforms: list[str], env_vars: dict, installed: Optional[set[str]] = None):
+    """
+    Display setup summary.
+
+    Args:
+        platforms: Configured platform names
+        env_vars: Environment variables (for site URLs)
+        installed: Installed plugin names from install_claude_plugins;
+            looked up only if not provided
+    """
+    # Imported here to keep them off the startup path
+    from rich import box
+    from rich.panel import Panel
+
+    # Build the whole summary first and print it in one call
+    lines = ["[bold]Configured platforms:[/bold]"]
     for platform in platforms:
-        config = PLATFORM_CONFIGS[platform]
-        url_var = config.get("url_var", "")
-        url = env_vars.get(url_var, "")
+        url = env_vars.get(_PLATFORM[platform].url_var, "")
         if url:
-            # Extract domain from URL
-            domain = url.replace("https://", "").replace("http://", "").rstrip("/")
-            console.print(f"  [green]OK[/green] {platform.capitalize()} ({domain})")
+            lines.append(f"  [green]OK[/green] {PLATFORM_LABELS[platform]} ({_display_host(url)})")
         else:
-            console.print(f"  [green]OK[/green] {platform.capitalize()}")
+            lines.append(f"  [green]OK[/green] {PLATFORM_LABELS[platform]}")
 
     # Show installed plugins if not skipped
-    if not SKIP_PLUGINS and check_claude_cli():
-        installed = get_installed_plugins()
-        plugin_names = {
-            "confluence": "confluence-assistant-skills",
-            "jira": "jira-assistant-skills",
-            "splunk": "splunk-assistant-skills",
-            "gitlab": "gitlab-assistant-skills",
-        }
-
-        relevant = [plugin_names[p] for p in platforms if plugin_names.get(p) in installed]
+    if not SKIP_PLUGINS and platforms and check_claude_cli():
+        if installed is None:
+            installed = set(get_installed_plugins())
+        relevant = [PLUGIN_NAMES[p] for p in platforms if p in PLUGIN_NAMES and PLUGIN_NAMES[p] in installed]
         if relevant:
-            console.print()
-            console.print("[bold]Installed Claude Code plugins:[/bold]")
+            lines.append("")
+            lines.append("[bold]Installed Claude Code plugins:[/bold]")
             for plugin in relevant:
-                console.print(f"  [green]OK[/green] {plugin}@as-plugins")
+                lines.append(f"  [green]OK[/green] {plugin}@as-plugins")
 
     # Sample commands
-    console.print()
-    console.print("[bold]Try these commands in Claude Code:[/bold]")
+    lines.append("")
+    lines.append("[bold]Try these commands in Claude Code:[/bold]")
     if "confluence" in platforms:
-        console.print('  "List all Confluence spaces"')
+        lines.append('  "List all Confluence spaces"')
     if "jira" in platforms:
-        console.print('  "Show my open JIRA issues"')
+        lines.append('  "Show my open JIRA issues"')
     if "splunk" in platforms:
-        console.print('  "Run a Splunk search for errors"')
+        lines.append('  "Run a Splunk search for errors"')
     if "gitlab" in platforms:
-        console.print('  "List my GitLab projects"')
+        lines.append('  "List my GitLab projects"')
+
+    console.print(Group(
+        "",
+        Panel(
+            "[bold green]Setup Complete![/bold green]",
+            box=box.DOUBLE,
+            expand=False
+        ),
+        "",
+        "\n".join(lines),
+    ))
 
 
 def main():
@@ -563,8 +711,8 @@ def main():
 
         # Install packages and plugins only
         install_python_packages(platforms_to_install)
-        install_claude_plugins(platforms_to_install)
-        show_summary(platforms_to_install, existing_env)
+        installed = install_claude_plugins(platforms_to_install)
+        show_summary(platforms_to_install, existing_env, installed=installed)
         return
 
     # Check for interactive mode
@@ -587,72 +735,124 @@ def main():
         if skip_creds:
             # User chose to keep existing config
             install_python_packages(platforms)
-            install_claude_plugins(platforms)
-            show_summary(platforms, existing_env)
+            installed = install_claude_plugins(platforms)
+            show_summary(platforms, existing_env, installed=installed)
             return
     else:
         # Fresh install - use standard menu
         platforms = select_platforms(configured)
         console.print()
 
+    # Platforms being (re)configured must be validated afresh
+    validation_cache.invalidate(platforms)
+
+    # Resolve CLI prerequisites up front rather than per platform
+    probe_platform_clis(platforms)
+
+    # Deferred to keep requests off the startup path
+    from .validate import close_sessions, validate_credentials
+
     # Track credentials to reconfigure
     credentials = {}
+    collected = {}
+    pending = []  # (platform, creds, future) for validations still running
     reuse_atlassian = None
 
-    # Collect credentials for each platform
-    for platform in platforms:
-        config = PLATFORM_CONFIGS[platform]
-        console.print(f"[bold cyan]{config['title']}[/bold cyan]")
-
-        # Check CLI prerequisites for CLI-based platforms
-        prereq_ok, prereq_error = check_platform_prerequisites(platform)
-        if not prereq_ok:
-            show_cli_install_instructions(config.get("cli_name", ""))
-            if Confirm.ask(f"  Continue without {platform}?", default=True):
-                console.print(f"  [dim]Skipping {platform}[/dim]")
-                console.print()
-                continue
-
-        # Check if we can reuse Atlassian credentials
-        if platform in ["jira"] and "confluence" in platforms and "confluence" in credentials:
-            if reuse_atlassian is None:
-                reuse_atlassian = Confirm.ask("Use same Atlassian credentials?", default=True)
-
-            if reuse_atlassian:
-                # Copy credentials from confluence
-                creds = credentials["confluence"].copy()
-                console.print("  Testing connection ... ", end="")
-
-                # Validate with JIRA endpoint
-                success, message = validate_credentials(platform, creds)
-                if success:
-                    console.print(f"[green]OK[/green] {message}")
-                    credentials[platform] = creds
+    # Validation runs in the background so its network round-trip overlaps
+    # with the user typing the next platform's credentials
+    with ThreadPoolExecutor(max_workers=max(1, len(platforms))) as validator:
+        # Collect credentials for each platform
+        for platform in platforms:
+            info = _PLATFORM[platform]
+            console.print(f"[bold cyan]{info.title}[/bold cyan]")
+
+            # Check CLI prerequisites for CLI-based platforms
+            prereq_ok, prereq_error = check_platform_prerequisites(platform)
+            if not prereq_ok:
+                show_cli_install_instructions(info.cli_name or "")
+                if Confirm.ask(f"  Continue without {platform}?", default=True):
+                    console.print(f"  [dim]Skipping {platform}[/dim]")
                     console.print()
                     continue
-                else:
-                    console.print(f"[yellow]Failed[/yellow] - {message}")
-                    console.print("  Collecting JIRA-specific credentials...")
-                    reuse_atlassian = False
 
-        # Collect credentials interactively (skips vars already set in sources)
-        creds = collect_credentials(platform, existing_env, sources=sources)
+            # Check if we can reuse Atlassian credentials
+            if platform in ["jira"] and "confluence" in platforms and "confluence" in collected:
+                if reuse_atlassian is None:
+                    reuse_atlassian = Confirm.ask("Use same Atlassian credentials?", default=True)
+
+                if reuse_atlassian:
+                    # Copy credentials from confluence under the JIRA_* names
+                    creds = {
+                        "JIRA_" + key[len("CONFLUENCE_"):]: value
+                        for key, value in collected["confluence"].items()
+                    }
+
+                    # Skipping is only safe once Confluence has accepted
+                    # these credentials; otherwise validate against JIRA below
+                    if SKIP_REUSE_VALIDATION:
+                        confluence_future = next(f for p, _, f in pending if p == "confluence")
+                        with console.status("  Waiting for Confluence validation ..."):
+                            confluence_ok, _ = confluence_future.result()
+
+                    if SKIP_REUSE_VALIDATION and confluence_ok:
+                        console.print("  Reusing Atlassian credentials [dim](validation skipped)[/dim]")
+                        credentials[platform] = creds
+                        console.print()
+                        continue
+
+                    # Validate with JIRA endpoint (synchronously - the
+                    # fallback below depends on the result)
+                    with console.status("  Testing connection ..."):
+                        success, message = validate_credentials(platform, creds)
+                    validation_cache.record(platform, creds, success, message)
+                    if success:
+                        console.print(f"  Testing connection ... [green]OK[/green] {message}")
+                        credentials[platform] = creds
+                        console.print()
+                        continue
+                    else:
+                        console.print(f"  Testing connection ... [yellow]Failed[/yellow] - {message}")
+                        console.print("  Collecting JIRA-specific credentials...")
+                        reuse_atlassian = False
+
+            # Collect credentials interactively (skips vars already set in sources)
+            creds = collect_credentials(platform, existing_env, sources=sources)
+            collected[platform] = creds
+
+            # Validate credentials while the next platform is collected
+            pending.append((platform, creds, validator.submit(validate_credentials, platform, creds)))
+            console.print()
 
-        # Validate credentials
-        console.print("  Testing connection ... ", end="")
-        success, message = validate_credentials(platform, creds)
+        # Report background validation results
+        if pending:
+            console.print("[bold]Testing Connections[/bold]")
+        for platform, creds, future in pending:
+            label = PLATFORM_LABELS[platform]
+            if future.done():
+                success, message = future.result()
+            else:
+                with console.status(f"  {label} ..."):
+                    success, message = future.result()
+            validation_cache.record(platform, creds, success, message)
 
-        if success:
-            console.print(f"[green]OK[/green] {message}")
-            credentials[platform] = creds
-        else:
-            console.print(f"[red]Failed[/red] - {message}")
-            if Confirm.ask("  Continue anyway?", default=False):
+            if success:
+                console.print(f"  {label} ... [green]OK[/green] {message}")
                 credentials[platform] = creds
             else:
-                console.print(f"  [dim]Skipping {platform}[/dim]")
+                console.print(f"  {label} ... [red]Failed[/red] - {message}")
+                if Confirm.ask("  Continue anyway?", default=False):
+                    credentials[platform] = creds
+                else:
+                    console.print(f"  [dim]Skipping {platform}[/dim]")
 
-        console.print()
+        if pending:
+            console.print()
+
+    validation_cache.save()
+    close_sessions()
+
+    # Keep the selection order regardless of when validation finished
+    credentials = {p: credentials[p] for p in platforms if p in credentials}
 
     # No platforms configured
     if not credentials:
@@ -660,8 +860,9 @@ def main():
         sys.exit(1)
 
     # Prepare env vars to save
-    # Start from ~/.env values (preserves $(security ...) keychain patterns)
-    home_env = load_env_file(ENV_FILE)
+    # Start from ~/.env values (preserves $(security ...) keychain patterns),
+    # reusing the copy parsed by detect_existing_config
+    home_env = dict(sources).get("~/.env", {})
     new_env_vars = home_env.copy()
     for platform, creds in credentials.items():
         for key, value in creds.items():
@@ -672,7 +873,7 @@ def main():
 
     # Save to ~/.env
     console.print("[bold]Saving Configuration[/bold]")
-    backup_path = save_env_file(ENV_FILE, new_env_vars)
+    backup_path = save_env_file(_env_file(), new_env_vars)
     if backup_path:
         console.print(f"  Backed up ~/.env -> {backup_path.name}")
     console.print(f"  Updated ~/.env with credentials")
@@ -682,10 +883,10 @@ def main():
     install_python_packages(list(credentials.keys()))
 
     # Install Claude Code plugins
-    install_claude_plugins(list(credentials.keys()))
+    installed = install_claude_plugins(list(credentials.keys()))
 
     # Show summary
-    show_summary(list(credentials.keys()), new_env_vars)
+    show_summary(list(credentials.keys()), new_env_vars, installed=installed)
 
 
 if __name__ == "__main__":
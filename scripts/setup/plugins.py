@@ -5,24 +5,82 @@ Claude Code plugin management for AS-Plugins Setup Wizard.
 Handles marketplace and plugin installation via the Claude CLI.
 """
 
+import functools
 import platform
+import re
 import shutil
 import subprocess
-from typing import Optional
+import threading
+from typing import Callable, Optional
 
 
+# Installed plugin line in 'claude plugin list' output: "  ❯ plugin-name@marketplace"
+_PLUGIN_LINE_RE = re.compile(r"(?m)^[ \t]*❯[ \t]*([^@\s]+)(?:@(\S*))?")
+
+
+# "Key: value" line in 'claude plugin info' output
+_KV_RE = re.compile(r"(?m)^[ \t]*([A-Za-z][\w -]*?)[ \t]*:[ \t]*(.*?)[ \t]*$")
+
+
+@functools.cache
 def check_cli_installed(cli_name: str) -> bool:
-    """Check if a CLI tool is installed and available in PATH."""
+    """
+    Check if a CLI tool is installed and available in PATH.
+
+    Cached per run; call check_cli_installed.cache_clear() to rescan.
+    """
     return shutil.which(cli_name) is not None
 
 
+# /etc/os-release ID / ID_LIKE value -> package-manager os_type
+_OS_RELEASE_IDS = {
+    "debian": "linux_apt",
+    "ubuntu": "linux_apt",
+    "fedora": "linux_dnf",
+    "rhel": "linux_dnf",
+    "centos": "linux_dnf",
+    "arch": "linux_pacman",
+}
+
+# Package-manager os_type -> the command it installs with
+_PACKAGE_MANAGERS = {
+    "linux_apt": "apt",
+    "linux_dnf": "dnf",
+    "linux_pacman": "pacman",
+}
+
+
+def _linux_from_os_release() -> Optional[str]:
+    """Map /etc/os-release ID and ID_LIKE to an os_type, if recognised."""
+    try:
+        with open("/etc/os-release") as f:
+            fields = dict(line.rstrip("\n").split("=", 1) for line in f if "=" in line)
+    except OSError:
+        return None
+
+    # Values may be double- or single-quoted
+    ids = f"{fields.get('ID', '')} {fields.get('ID_LIKE', '')}".replace('"', "").replace("'", "").split()
+    for distro_id in ids:
+        if distro_id in _OS_RELEASE_IDS:
+            return _OS_RELEASE_IDS[distro_id]
+    return None
+
+
+@functools.lru_cache(maxsize=1)
 def detect_os() -> str:
-    """Detect the current operating system and package manager."""
+    """Detect the current operating system and package manager (cached)."""
     system = platform.system().lower()
     if system == "darwin":
         return "macos"
     elif system == "linux":
-        # Try to detect package manager
+        # One file read usually identifies the distro family. Older releases
+        # of a family may lack its manager (e.g. CentOS 7 has yum, not dnf),
+        # so only trust the match if the command is on PATH.
+        os_type = _linux_from_os_release()
+        if os_type and shutil.which(_PACKAGE_MANAGERS[os_type]):
+            return os_type
+
+        # Otherwise look for a package manager on PATH
         if shutil.which("apt"):
             return "linux_apt"
         elif shutil.which("dnf"):
@@ -59,8 +117,9 @@ def get_cli_install_instructions(cli_name: str) -> dict:
     return instructions.get(cli_name, {})
 
 
+@functools.lru_cache(maxsize=1)
 def check_claude_cli() -> bool:
-    """Check if Claude Code CLI is available."""
+    """Check if Claude Code CLI is available (cached per run)."""
     try:
         result = subprocess.run(
             ["claude", "--version"],
@@ -73,18 +132,39 @@ def check_claude_cli() -> bool:
         return False
 
 
-def run_claude_command(args: list[str], timeout: int = 60) -> tuple[bool, str]:
+def run_claude_command(
+    args: list[str],
+    timeout: int = 60,
+    discard_output: bool = False,
+    on_line: Optional[Callable[[str], None]] = None,
+) -> tuple[bool, str]:
     """
     Run a Claude CLI command.
 
     Args:
         args: Command arguments (without 'claude' prefix)
         timeout: Command timeout in seconds
+        discard_output: Send output to /dev/null when only the exit status matters
+        on_line: Optional callback receiving each output line as it is
+            printed (stdout and stderr combined), for long-running commands
 
     Returns:
-        Tuple of (success, output)
+        Tuple of (success, output); output is empty when discarded
     """
     try:
+        if on_line is not None:
+            return _stream_claude_command(args, timeout, on_line)
+
+        if discard_output:
+            result = subprocess.run(
+                ["claude"] + args,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=timeout,
+                check=False,
+            )
+            return result.returncode == 0, ""
+
         result = subprocess.run(
             ["claude"] + args,
             capture_output=True,
@@ -102,8 +182,48 @@ def run_claude_command(args: list[str], timeout: int = 60) -> tuple[bool, str]:
         return False, str(e)
 
 
+def _stream_claude_command(
+    args: list[str], timeout: int, on_line: Callable[[str], None]
+) -> tuple[bool, str]:
+    """Run a Claude CLI command, passing each output line to on_line as it arrives."""
+    lines = []
+    expired = threading.Event()
+
+    with subprocess.Popen(
+        ["claude"] + args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    ) as proc:
+        # Reading blocks until output or EOF, so enforce the timeout with a timer
+        def _kill():
+            expired.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, _kill)
+        timer.start()
+        try:
+            for line in proc.stdout:
+                line = line.rstrip("\n")
+                lines.append(line)
+                on_line(line)
+            proc.wait()
+        finally:
+            timer.cancel()
+
+    if expired.is_set():
+        return False, "Command timed out"
+    return proc.returncode == 0, "\n".join(lines).strip()
+
+
+@functools.lru_cache(maxsize=1)
 def check_marketplace_added() -> bool:
-    """Check if as-plugins marketplace is already added."""
+    """
+    Check if as-plugins marketplace is already added.
+
+    Cached until add_marketplace() or remove_marketplace() succeeds.
+    """
     success, output = run_claude_command(["plugin", "marketplace", "list"])
     if not success:
         return False
@@ -115,63 +235,139 @@ def check_marketplace_added() -> bool:
 def add_marketplace() -> bool:
     """Add the as-plugins marketplace."""
     success, _ = run_claude_command(
-        ["plugin", "marketplace", "add", "grandcamel/as-plugins"]
+        ["plugin", "marketplace", "add", "grandcamel/as-plugins"],
+        discard_output=True,
     )
+    if success:
+        check_marketplace_added.cache_clear()
     return success
 
 
 def remove_marketplace() -> bool:
     """Remove the as-plugins marketplace."""
     success, _ = run_claude_command(
-        ["plugin", "marketplace", "remove", "as-plugins"]
+        ["plugin", "marketplace", "remove", "as-plugins"],
+        discard_output=True,
     )
+    if success:
+        check_marketplace_added.cache_clear()
     return success
 
 
-def get_installed_plugins() -> list[str]:
-    """Get list of installed plugin names."""
+def _parse_plugin_list(output: str) -> list[tuple[str, str]]:
+    """Parse 'claude plugin list' output into (plugin, marketplace) pairs."""
+    return _PLUGIN_LINE_RE.findall(output)
+
+
+@functools.lru_cache(maxsize=1)
+def _list_plugins() -> tuple[tuple[str, str], ...]:
+    """
+    Run 'claude plugin list' once and cache the parsed (plugin, marketplace) pairs.
+
+    Cleared whenever a plugin is installed or uninstalled.
+    """
     success, output = run_claude_command(["plugin", "list"])
     if not success:
-        return []
+        return ()
 
-    # Parse plugin list output
-    # Format: "  ❯ plugin-name@marketplace"
-    plugins = []
-    for line in output.splitlines():
-        line = line.strip()
+    return tuple(_parse_plugin_list(output))
 
-        # Look for lines starting with ❯ (bullet character)
-        if line.startswith("❯"):
-            # Extract: "❯ plugin-name@marketplace" -> "plugin-name"
-            parts = line[1:].strip().split("@")
-            if parts:
-                name = parts[0].strip()
-                if name:
-                    plugins.append(name)
 
-    return plugins
+def get_installed_plugins() -> list[str]:
+    """Get list of installed plugin names."""
+    return [name for name, _ in _list_plugins()]
+
+
+def get_plugin_state() -> dict:
+    """
+    Snapshot marketplace and plugin state with as few CLI calls as possible.
+
+    Shares one cached 'claude plugin list' run with get_installed_plugins().
+    If any installed plugin comes from the as-plugins marketplace, the
+    marketplace is known to be added and 'claude plugin marketplace list'
+    is skipped.
+
+    Returns:
+        {"marketplace_added": bool, "installed": set of plugin names}
+    """
+    plugins = _list_plugins()
 
+    marketplace_added = any(marketplace == "as-plugins" for _, marketplace in plugins)
+    if not marketplace_added:
+        marketplace_added = check_marketplace_added()
+
+    return {
+        "marketplace_added": marketplace_added,
+        "installed": {name for name, _ in plugins},
+    }
 
-def install_plugin(plugin_name: str) -> bool:
+
+def install_plugin(plugin_name: str, on_line: Optional[Callable[[str], None]] = None) -> bool:
     """
     Install a plugin from the as-plugins marketplace.
 
     Args:
         plugin_name: Plugin name (e.g., "jira-assistant-skills")
+        on_line: Optional callback receiving CLI output lines as they arrive
 
     Returns:
         True if installation succeeded
     """
     # Install with @as-plugins suffix and user scope
-    success, output = run_claude_command([
+    success, _ = run_claude_command([
         "plugin", "install",
         f"{plugin_name}@as-plugins",
         "--scope", "user",
-    ], timeout=120)  # Plugins may take time to download
+    ], timeout=120, discard_output=on_line is None, on_line=on_line)  # Plugins may take time to download
 
+    if success:
+        _list_plugins.cache_clear()
     return success
 
 
+@functools.lru_cache(maxsize=1)
+def supports_batch_install() -> bool:
+    """Check whether 'claude plugin install' accepts several plugins at once."""
+    success, output = run_claude_command(["plugin", "install", "--help"])
+    # Variadic arguments are shown as e.g. "<plugins...>"
+    return success and re.search(r"<[\w-]+\.\.\.>", output) is not None
+
+
+def install_plugins_batch(
+    plugin_names: list[str], on_line: Optional[Callable[[str], None]] = None
+) -> dict[str, bool]:
+    """
+    Install several plugins from the as-plugins marketplace.
+
+    Uses a single Claude CLI invocation when the CLI supports it, and
+    falls back to sequential per-plugin installs otherwise (or when the
+    batch call fails, to find out which plugins failed).
+
+    Args:
+        plugin_names: Plugin names (e.g., ["jira-assistant-skills"])
+        on_line: Optional callback receiving CLI output lines as they arrive
+
+    Returns:
+        Dictionary of plugin name -> True if installation succeeded
+    """
+    if not plugin_names:
+        return {}
+
+    if len(plugin_names) > 1 and supports_batch_install():
+        success, _ = run_claude_command([
+            "plugin", "install",
+            *(f"{name}@as-plugins" for name in plugin_names),
+            "--scope", "user",
+        ], timeout=120 * len(plugin_names), discard_output=on_line is None, on_line=on_line)
+        if success:
+            _list_plugins.cache_clear()
+            return {name: True for name in plugin_names}
+
+    # One at a time: each install rewrites the same Claude plugin/settings
+    # files, so concurrent installs could overwrite each other's changes
+    return {name: install_plugin(name, on_line) for name in plugin_names}
+
+
 def uninstall_plugin(plugin_name: str) -> bool:
     """
     Uninstall a plugin.
@@ -184,7 +380,9 @@ def uninstall_plugin(plugin_name: str) -> bool:
     """
     success, _ = run_claude_command([
         "plugin", "uninstall", plugin_name,
-    ])
+    ], discard_output=True)
+    if success:
+        _list_plugins.cache_clear()
     return success
 
 
@@ -208,10 +406,8 @@ def get_plugin_info(plugin_name: str) -> Optional[dict]:
     # Parse output into dict (format varies)
     info = {"name": plugin_name, "raw": output}
 
-    # Try to extract common fields
-    for line in output.splitlines():
-        if ":" in line:
-            key, _, value = line.partition(":")
-            info[key.strip().lower()] = value.strip()
+    # Try to extract common fields (first occurrence of a key wins)
+    for key, value in _KV_RE.findall(output):
+        info.setdefault(key.strip().lower(), value)
 
     return info
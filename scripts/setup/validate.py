@@ -6,16 +6,223 @@ Tests connectivity to Confluence, JIRA, and Splunk APIs
 to verify credentials are correct before saving.
 """
 
+import atexit
 import base64
+import functools
+import importlib.util
+import json
 import os
-from urllib.parse import urljoin, urlparse, urlunparse
+import ssl
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Iterator, Mapping
+from urllib.parse import urlparse, urlunparse
+
+try:
+    from orjson import loads as _json_loads  # Optional - faster JSON decoding
+except ImportError:
+    _json_loads = json.loads
+
+# requests timeout as (connect, read) seconds: unreachable hosts fail after
+# 3s while slow APIs still get 10s to respond
+_TIMEOUT = (3, 10)
+
+# Transient gateway errors are retried (up to _RETRY_TOTAL times, with
+# exponential backoff). Connect/read failures are not, so a dead host
+# still fails after a single timeout.
+_RETRY_STATUSES = (502, 503, 504)
+_RETRY_TOTAL = 2
+_RETRY_BACKOFF = 0.2
+
+
+@functools.cache
+def _requests():
+    """Import requests on first use, so wizard flows without network checks skip it."""
+    import requests
+
+    return requests
+
+
+@functools.cache
+def _build_session():
+    """
+    Shared session so repeated and concurrent validations reuse pooled
+    connections instead of paying a new TLS handshake each time.
+    """
+    requests = _requests()
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers.update({"Accept": "application/json"})
+    retry = Retry(
+        total=_RETRY_TOTAL,
+        connect=0,
+        read=0,
+        backoff_factor=_RETRY_BACKOFF,
+        status_forcelist=_RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "HEAD", "POST"}),
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# functools.cache does not serialise the first call, and validations run
+# on worker threads, so the shared clients are first built under a lock
+_SESSION_LOCK = threading.Lock()
+
+
+def _session():
+    """Get the shared session, building it on first use (thread-safe)."""
+    if not _build_session.cache_info().currsize:
+        with _SESSION_LOCK:
+            return _build_session()
+    return _build_session()
+
+
+@functools.lru_cache(maxsize=1)
+def _build_h2_client():
+    """
+    HTTP/2 client for the Atlassian endpoint probes, or None to use requests.
+
+    Opt-in via AS_PLUGINS_HTTP2=true, and only if httpx[http2] is installed.
+    Over HTTP/2 the concurrent probes to one site share a single
+    multiplexed connection rather than opening one connection each.
+    """
+    if os.environ.get("AS_PLUGINS_HTTP2", "false").lower() != "true":
+        return None
+    if importlib.util.find_spec("httpx") is None or importlib.util.find_spec("h2") is None:
+        return None
+
+    import httpx
+
+    # Trust the same CAs as the requests path (REQUESTS_CA_BUNDLE /
+    # CURL_CA_BUNDLE, else requests' bundle); proxies come from the
+    # environment in both
+    ca_bundle = (
+        os.environ.get("REQUESTS_CA_BUNDLE")
+        or os.environ.get("CURL_CA_BUNDLE")
+        or _requests().certs.where()
+    )
+    if os.path.isdir(ca_bundle):
+        ssl_context = ssl.create_default_context(capath=ca_bundle)
+    else:
+        ssl_context = ssl.create_default_context(cafile=ca_bundle)
+
+    client = httpx.Client(
+        http2=True,
+        verify=ssl_context,
+        trust_env=True,
+        headers={"Accept": "application/json"},
+        timeout=httpx.Timeout(_TIMEOUT[1], connect=_TIMEOUT[0]),
+    )
+    atexit.register(client.close)
+    return client
+
+
+_H2_CLIENT_LOCK = threading.Lock()
+
+
+def _h2_client():
+    """Get the HTTP/2 client (or None), building it on first use (thread-safe)."""
+    if not _build_h2_client.cache_info().currsize:
+        with _H2_CLIENT_LOCK:
+            return _build_h2_client()
+    return _build_h2_client()
+
+
+def close_sessions():
+    """Close pooled HTTP connections once no more validations will run."""
+    if _build_session.cache_info().currsize:
+        _build_session().close()
+    if _build_h2_client.cache_info().currsize:
+        client = _build_h2_client()
+        _build_h2_client.cache_clear()
+        if client is not None:
+            client.close()
+
+
+@functools.lru_cache(maxsize=32)
+def _basic_auth_headers(email: str, token: str) -> Mapping[str, str]:
+    """Build (once per credential pair) a read-only Basic auth header mapping."""
+    auth_string = f"{email}:{token}"
+    auth_bytes = base64.b64encode(auth_string.encode()).decode()
+    return MappingProxyType({"Authorization": f"Basic {auth_bytes}"})
+
 
-import requests
-import urllib3
+def _h2_request(client, method: str, url: str, headers: Mapping[str, str]):
+    """Send a request with the HTTP/2 client, applying the session's status retry policy."""
+    for attempt in range(_RETRY_TOTAL + 1):
+        # Same schedule as urllib3's Retry: no delay before the first retry
+        if attempt > 1:
+            time.sleep(_RETRY_BACKOFF * 2 ** (attempt - 1))
+        response = client.request(method, url, headers=headers, follow_redirects=True)
+        if response.status_code not in _RETRY_STATUSES:
+            break
+    return response
 
-# Suppress InsecureRequestWarning when SSL verification is intentionally disabled
-# This is only used for Splunk with self-signed certificates
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+def _probe(method: str, url: str, headers: Mapping[str, str]):
+    """
+    Request an endpoint; a HEAD the server rejects is retried as GET.
+
+    Uses the HTTP/2 client when available. Its errors are re-raised as
+    the equivalent requests exceptions so callers handle both alike.
+    """
+    client = _h2_client()
+    if client is None:
+        session = _session()
+        response = session.request(method, url, headers=headers, timeout=_TIMEOUT, allow_redirects=True)
+        if method == "HEAD" and response.status_code == 405:
+            response = session.get(url, headers=headers, timeout=_TIMEOUT)
+        return response
+
+    import httpx
+
+    requests = _requests()
+
+    try:
+        response = _h2_request(client, method, url, headers)
+        if method == "HEAD" and response.status_code == 405:
+            response = _h2_request(client, "GET", url, headers)
+        return response
+    except httpx.TimeoutException as e:
+        raise requests.exceptions.Timeout(str(e)) from e
+    except httpx.TransportError as e:
+        raise requests.exceptions.ConnectionError(str(e)) from e
+
+
+@contextmanager
+def _fallback_probes(
+    probes: list[tuple[str, str]], headers: Mapping[str, str]
+) -> Iterator[Iterator[Future]]:
+    """
+    Request the primary (method, url) probe, then the fallbacks on demand.
+
+    Yields an iterator of futures in the same order as probes. The first
+    probe is sent alone, so rejected credentials cost one authenticated
+    request; the fallbacks are only started (all at once) when the caller
+    moves past the primary result. Unfinished probes are abandoned when
+    the block exits.
+    """
+    executor = ThreadPoolExecutor(max_workers=len(probes))
+
+    def _futures() -> Iterator[Future]:
+        method, url = probes[0]
+        yield executor.submit(_probe, method, url, headers)
+        yield from [executor.submit(_probe, method, url, headers) for method, url in probes[1:]]
+
+    try:
+        yield _futures()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 def validate_confluence(url: str, email: str, token: str) -> tuple[bool, str]:
@@ -30,13 +237,9 @@ def validate_confluence(url: str, email: str, token: str) -> tuple[bool, str]:
     Returns:
         Tuple of (success, message)
     """
-    # Create auth header
-    auth_string = f"{email}:{token}"
-    auth_bytes = base64.b64encode(auth_string.encode()).decode()
-    headers = {
-        "Authorization": f"Basic {auth_bytes}",
-        "Accept": "application/json",
-    }
+    requests = _requests()
+
+    headers = _basic_auth_headers(email, token)
 
     # Try multiple endpoints (v1 API is more reliable)
     endpoints = [
@@ -45,40 +248,50 @@ def validate_confluence(url: str, email: str, token: str) -> tuple[bool, str]:
         ("wiki/rest/api/space?limit=1", "spaces"),
     ]
 
+    # Try the user endpoint first; the space listings are only probed
+    # (concurrently) if it does not settle the result
     last_status = None
-    for path, endpoint_type in endpoints:
-        try:
-            api_url = urljoin(url + "/", path)
-            response = requests.get(api_url, headers=headers, timeout=10)
-            last_status = response.status_code
-
-            if response.status_code == 200:
-                data = response.json()
-                if endpoint_type == "user":
-                    name = data.get("displayName", data.get("username", ""))
-                    return True, f"Connected as {name}" if name else "Connected"
-                return True, "Connected"
-
-            # 401 is definitely invalid credentials
-            if response.status_code == 401:
-                return False, "Invalid credentials (401 Unauthorized)"
-
-            # 403 might mean credentials work but endpoint is restricted
-            # Continue to try other endpoints
-            if response.status_code == 403:
-                continue
-
-            # 404 means endpoint doesn't exist, try next
-            if response.status_code == 404:
+    base = url.rstrip("/") + "/"  # endpoint paths are relative, so plain concatenation
+    # Only the user endpoint's body is used; the space listings just need
+    # a status code, so HEAD them and skip the body transfer
+    probes = [("GET" if endpoint_type == "user" else "HEAD", base + path) for path, endpoint_type in endpoints]
+    with _fallback_probes(probes, headers) as futures:
+        for (_, endpoint_type), future in zip(endpoints, futures):
+            try:
+                response = future.result()
+                last_status = response.status_code
+
+                if response.status_code == 200:
+                    if endpoint_type == "user":
+                        data = _json_loads(response.content)
+                        name = data.get("displayName", data.get("username", ""))
+                        return True, f"Connected as {name}" if name else "Connected"
+                    # HEAD has no body to parse, so require a JSON response;
+                    # a login page reached through redirects is not success
+                    if "application/json" not in response.headers.get("Content-Type", ""):
+                        continue
+                    return True, "Connected"
+
+                # 401 is definitely invalid credentials
+                if response.status_code == 401:
+                    return False, "Invalid credentials (401 Unauthorized)"
+
+                # 403 might mean credentials work but endpoint is restricted
+                # Continue to try other endpoints
+                if response.status_code == 403:
+                    continue
+
+                # 404 means endpoint doesn't exist, try next
+                if response.status_code == 404:
+                    continue
+
+            except requests.exceptions.Timeout:
+                return False, "Connection timed out"
+            except requests.exceptions.ConnectionError:
+                return False, "Could not connect to server"
+            except Exception:
                 continue
 
-        except requests.exceptions.Timeout:
-            return False, "Connection timed out"
-        except requests.exceptions.ConnectionError:
-            return False, "Could not connect to server"
-        except Exception:
-            continue
-
     # If we got here, no endpoint worked
     if last_status == 403:
         return False, "Access denied - check API token permissions"
@@ -101,13 +314,9 @@ def validate_jira(url: str, email: str, token: str) -> tuple[bool, str]:
     Returns:
         Tuple of (success, message)
     """
-    # Create auth header
-    auth_string = f"{email}:{token}"
-    auth_bytes = base64.b64encode(auth_string.encode()).decode()
-    headers = {
-        "Authorization": f"Basic {auth_bytes}",
-        "Accept": "application/json",
-    }
+    requests = _requests()
+
+    headers = _basic_auth_headers(email, token)
 
     # Try multiple endpoints
     endpoints = [
@@ -115,34 +324,37 @@ def validate_jira(url: str, email: str, token: str) -> tuple[bool, str]:
         ("rest/api/2/myself", "user"),
     ]
 
+    # Try API v3 first, and v2 only if v3 does not settle the result
     last_status = None
-    for path, endpoint_type in endpoints:
-        try:
-            api_url = urljoin(url + "/", path)
-            response = requests.get(api_url, headers=headers, timeout=10)
-            last_status = response.status_code
+    base = url.rstrip("/") + "/"  # endpoint paths are relative, so plain concatenation
+    probes = [("GET", base + path) for path, _ in endpoints]
+    with _fallback_probes(probes, headers) as futures:
+        for future in futures:
+            try:
+                response = future.result()
+                last_status = response.status_code
 
-            if response.status_code == 200:
-                data = response.json()
-                display_name = data.get("displayName", "Unknown")
-                return True, f"Connected as {display_name}"
+                if response.status_code == 200:
+                    data = _json_loads(response.content)
+                    display_name = data.get("displayName", "Unknown")
+                    return True, f"Connected as {display_name}"
 
-            if response.status_code == 401:
-                return False, "Invalid credentials (401 Unauthorized)"
+                if response.status_code == 401:
+                    return False, "Invalid credentials (401 Unauthorized)"
 
-            if response.status_code == 403:
-                return False, "Access denied - check API token permissions"
+                if response.status_code == 403:
+                    return False, "Access denied - check API token permissions"
 
-            # 404 means endpoint doesn't exist, try next
-            if response.status_code == 404:
-                continue
+                # 404 means endpoint doesn't exist, try next
+                if response.status_code == 404:
+                    continue
 
-        except requests.exceptions.Timeout:
-            return False, "Connection timed out"
-        except requests.exceptions.ConnectionError:
-            return False, "Could not connect to server"
-        except Exception:
-            continue
+            except requests.exceptions.Timeout:
+                return False, "Connection timed out"
+            except requests.exceptions.ConnectionError:
+                return False, "Could not connect to server"
+            except Exception:
+                continue
 
     if last_status == 404:
         return False, "JIRA not found at this URL"
@@ -151,6 +363,17 @@ def validate_jira(url: str, email: str, token: str) -> tuple[bool, str]:
     return False, "Could not validate credentials"
 
 
+@functools.cache
+def _disable_insecure_warnings():
+    """
+    Suppress InsecureRequestWarning when SSL verification is intentionally disabled.
+    This is only used for Splunk with self-signed certificates.
+    """
+    import urllib3
+
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+
 def _get_splunk_ssl_verify():
     """
     Determine SSL verification setting for Splunk connections.
@@ -162,6 +385,8 @@ def _get_splunk_ssl_verify():
     Returns:
         str (cert path), True (verify with system certs), or False (no verification)
     """
+    _disable_insecure_warnings()
+
     # Check for custom CA certificate
     ca_cert = os.environ.get("SPLUNK_CA_CERT", "")
     if ca_cert and os.path.isfile(ca_cert):
@@ -222,6 +447,8 @@ def validate_splunk(url: str, username: str, password: str) -> tuple[bool, str]:
     Returns:
         Tuple of (success, message)
     """
+    requests = _requests()
+
     normalized_url = _normalize_splunk_url(url)
     api_url = f"{normalized_url}/services/auth/login"
     request_data = {
@@ -234,11 +461,11 @@ def validate_splunk(url: str, username: str, password: str) -> tuple[bool, str]:
 
     def _make_request(verify_setting):
         """Make the authentication request with given SSL setting."""
-        response = requests.post(
+        response = _session().post(
             api_url,
             data=request_data,
             verify=verify_setting,
-            timeout=10,
+            timeout=_TIMEOUT,
         )
         return response
 
@@ -306,6 +533,8 @@ def validate_gitlab(host: str, token: str) -> tuple[bool, str]:
     Returns:
         Tuple of (success, message)
     """
+    requests = _requests()
+
     # Normalize host URL (add scheme if missing, default to gitlab.com)
     host = _normalize_gitlab_url(host)
 
@@ -313,10 +542,10 @@ def validate_gitlab(host: str, token: str) -> tuple[bool, str]:
     try:
         headers = {"PRIVATE-TOKEN": token}
         api_url = f"{host}/api/v4/user"
-        response = requests.get(api_url, headers=headers, timeout=10)
+        response = _session().get(api_url, headers=headers, timeout=_TIMEOUT)
 
         if response.status_code == 200:
-            data = response.json()
+            data = _json_loads(response.content)
             username = data.get("username", "Unknown")
             return True, f"Connected as @{username}"
 
@@ -336,6 +565,16 @@ def validate_gitlab(host: str, token: str) -> tuple[bool, str]:
         return False, f"Error: {str(e)}"
 
 
+# Validator and the credential variables it takes (in argument order), per platform
+_VALIDATORS = {
+    "confluence": (validate_confluence, ("CONFLUENCE_SITE_URL", "CONFLUENCE_EMAIL", "CONFLUENCE_API_TOKEN")),
+    "jira": (validate_jira, ("JIRA_SITE_URL", "JIRA_EMAIL", "JIRA_API_TOKEN")),
+    "splunk": (validate_splunk, ("SPLUNK_SITE_URL", "SPLUNK_USERNAME", "SPLUNK_PASSWORD")),
+    # An empty GITLAB_HOST means gitlab.com (see _normalize_gitlab_url)
+    "gitlab": (validate_gitlab, ("GITLAB_HOST", "GITLAB_TOKEN")),
+}
+
+
 def validate_credentials(platform: str, credentials: dict) -> tuple[bool, str]:
     """
     Validate credentials for a platform.
@@ -347,31 +586,32 @@ def validate_credentials(platform: str, credentials: dict) -> tuple[bool, str]:
     Returns:
         Tuple of (success, message)
     """
-    if platform == "confluence":
-        return validate_confluence(
-            url=credentials.get("CONFLUENCE_SITE_URL", ""),
-            email=credentials.get("CONFLUENCE_EMAIL", ""),
-            token=credentials.get("CONFLUENCE_API_TOKEN", ""),
-        )
+    validator, var_names = _VALIDATORS.get(platform, (None, ()))
+    if validator is None:
+        return False, f"Unknown platform: {platform}"
 
-    if platform == "jira":
-        return validate_jira(
-            url=credentials.get("JIRA_SITE_URL", ""),
-            email=credentials.get("JIRA_EMAIL", ""),
-            token=credentials.get("JIRA_API_TOKEN", ""),
-        )
+    return validator(*(credentials.get(var, "") for var in var_names))
 
-    if platform == "splunk":
-        return validate_splunk(
-            url=credentials.get("SPLUNK_SITE_URL", ""),
-            username=credentials.get("SPLUNK_USERNAME", ""),
-            password=credentials.get("SPLUNK_PASSWORD", ""),
-        )
 
-    if platform == "gitlab":
-        return validate_gitlab(
-            host=credentials.get("GITLAB_HOST", "https://gitlab.com"),
-            token=credentials.get("GITLAB_TOKEN", ""),
-        )
+def validate_all(credentials_by_platform: dict) -> dict[str, tuple[bool, str]]:
+    """
+    Validate several platforms concurrently.
 
-    return False, f"Unknown platform: {platform}"
+    Each validation is an independent network wait, so they run in
+    parallel and the total time is that of the slowest platform.
+
+    Args:
+        credentials_by_platform: Dictionary of platform -> credential variables
+
+    Returns:
+        Dictionary of platform -> (success, message)
+    """
+    if not credentials_by_platform:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=len(credentials_by_platform)) as executor:
+        futures = {
+            platform: executor.submit(validate_credentials, platform, creds)
+            for platform, creds in credentials_by_platform.items()
+        }
+        return {platform: future.result() for platform, future in futures.items()}
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Validation result cache for AS-Plugins Setup Wizard.
+
+Remembers successful credential validations across runs so repeated
+setup.sh / --validate-only invocations skip the network round-trip
+when credentials are unchanged.
+
+Entries are keyed by an HMAC-SHA256 of the platform and its credentials,
+using a random per-install key, and expire after CACHE_TTL seconds.
+Credentials are never written, and without the key file (600) the
+cache cannot be used to check guessed passwords.
+"""
+
+import functools
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import time
+from pathlib import Path
+from typing import Optional
+
+CACHE_FILE = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "as-plugins" / "validation.json"
+KEY_FILE = CACHE_FILE.with_name("validation.key")
+CACHE_TTL = 3600  # seconds
+
+_cache: Optional[dict] = None
+
+
+def _write_private(path: Path, data: bytes):
+    """Write a file that is created with 600 permissions (never wider)."""
+    # Remove any leftover copy, since O_CREAT keeps an existing file's mode
+    path.unlink(missing_ok=True)
+    fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+
+
+@functools.lru_cache(maxsize=1)
+def _secret() -> bytes:
+    """
+    Load the per-install HMAC key, creating it on first use.
+
+    If the key cannot be stored, a key for this run only is used, so
+    nothing cached now will match on later runs.
+    """
+    try:
+        secret = KEY_FILE.read_bytes()
+        if len(secret) >= 32:
+            return secret
+    except OSError:
+        pass
+
+    secret = secrets.token_bytes(32)
+    try:
+        KEY_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _write_private(KEY_FILE, secret)
+    except OSError:
+        pass
+    return secret
+
+
+def _key(platform: str, creds: dict) -> str:
+    """HMAC a platform and its credentials into a cache key."""
+    payload = json.dumps([platform, sorted(creds.items())])
+    return hmac.new(_secret(), payload.encode(), hashlib.sha256).hexdigest()
+
+
+def _load() -> dict:
+    """Load the cache file once per run, dropping expired entries."""
+    global _cache
+    if _cache is None:
+        try:
+            data = json.loads(CACHE_FILE.read_text())
+        except (OSError, ValueError):
+            data = {}
+
+        now = time.time()
+        _cache = {
+            key: entry for key, entry in data.items()
+            if isinstance(entry, dict) and now - entry.get("ts", 0) < CACHE_TTL
+        }
+    return _cache
+
+
+def lookup(platform: str, creds: dict) -> Optional[tuple[bool, str]]:
+    """
+    Get a cached validation result.
+
+    Args:
+        platform: Platform name
+        creds: Dictionary of credential variables
+
+    Returns:
+        (True, message) if these credentials validated recently, None otherwise
+    """
+    entry = _load().get(_key(platform, creds))
+    if entry is None:
+        return None
+    return True, entry.get("message", "Connected")
+
+
+def record(platform: str, creds: dict, valid: bool, message: str):
+    """Remember a successful validation, or forget the entry on failure."""
+    cache = _load()
+    key = _key(platform, creds)
+    if valid:
+        cache[key] = {"platform": platform, "message": message, "ts": time.time()}
+    else:
+        cache.pop(key, None)
+
+
+def invalidate(platforms: list[str]):
+    """Forget all cached results for the given platforms."""
+    cache = _load()
+    for key in [k for k, entry in cache.items() if entry.get("platform") in platforms]:
+        del cache[key]
+
+
+def save():
+    """Write the cache atomically (600 permissions). Errors are ignored."""
+    if _cache is None:
+        return
+
+    tmp_path = CACHE_FILE.with_suffix(".tmp")
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _write_private(tmp_path, json.dumps(_cache).encode())
+        os.replace(tmp_path, CACHE_FILE)
+    except OSError:
+        pass